@@ -5,18 +5,23 @@ Improved version: Attractive UI, exact template match, image handling, more defa
 """
 from __future__ import annotations
 import io
-import re
+import shutil
 import requests
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import attrgetter
 from typing import List, Optional
+from xml.sax.saxutils import escape
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
-from pptx.enum.shapes import MSO_SHAPE, MSO_CONNECTOR
-from pptx.oxml.ns import qn
-from pptx.util import Length  # For type checking
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 
 # -------------------------
 # Configuration / Constants (Updated for exact template match)
@@ -50,6 +55,7 @@ COLOR_ZSCALER_YELLOW = RGBColor(255, 192, 0)
 FONT_NAME = "Century Gothic"
 SIZE_TITLE = Pt(36)
 SIZE_SLIDE_TITLE = Pt(28)
+SIZE_BRAND = Pt(24)  # PROSERVE wordmark next to the logo
 SIZE_SUBTITLE = Pt(20)
 SIZE_HEADER = Pt(18)
 SIZE_BODY = Pt(14)
@@ -61,14 +67,30 @@ MARGIN_LEFT = Inches(0.45)
 MARGIN_TOP = Inches(0.45)
 MARGIN_RIGHT = Inches(0.45)
 FOOTER_HEIGHT = Inches(0.35)
+_LOGO_W = int(Inches(1.5))  # Tweaked for template
+_LOGO_H = int(Inches(0.4))
+# Inch offsets/sizes used by the slide builders, converted once at import to plain EMU ints
+# (no Length subclass instances; they only ever feed arithmetic and XML attributes)
+_IN = {x: int(Inches(x)) for x in (0.1, 0.2, 0.3, 0.4, 0.45, 0.5, 0.6, 0.8, 1.0, 1.2, 1.5, 1.6, 1.7, 2.0, 2.1, 2.4, 2.5, 2.6, 3.0, 3.1, 4.0, 5.5, 6.0, 7.5, 8.0, 9.0)}
+# Next Steps bullet rows (slide 12)
+_BULLET_LEFT = int(MARGIN_LEFT + Inches(0.3))
+_BULLET_W = int(Inches(3.5))
+_ROW_STEP = int(Inches(0.4))
+_LONG_LEFT = int(Inches(5.8))
+# Table column widths in EMU (exact from template)
+_MILESTONE_COLS = tuple(int(Inches(w)) for w in (4.0, 2.0, 2.0, 2.0))
+_ROLLOUT_COLS = (int(Inches(2.0)),) * 5
+_OBJ_COLS = tuple(int(Inches(w)) for w in (3.5, 3.5, 3.0))
+_DEL_COLS = tuple(int(Inches(w)) for w in (5.0, 3.0))
+_OPEN_COLS = tuple(int(Inches(w)) for w in (2.5, 1.5, 1.5, 4.5))
 
 # Assets (added alt logos, bg if needed)
 LOGO_URL = "https://upload.wikimedia.org/wikipedia/commons/thumb/8/8b/Zscaler_logo.svg/512px-Zscaler_logo.svg.png"
 FALLBACK_LOGO_URL = "https://brandlogos.net/wp-content/uploads/2022/12/zscaler-logo_brandlogos.net_mdymr.png"
 BG_URL = "https://slidemodel.com/wp-content/uploads/13081-01-gradient-designs-powerpoint-backgrounds-16x9-1.jpg"  # Blue gradient with faded office photo
 
-# Date regex
-DATE_RE = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+# python-pptx's default table style (Medium Style 2 - Accent 1)
+TABLE_STYLE_ID = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
 
 # RAG Colors for status (added from template)
 RAG_COLORS = {
@@ -79,92 +101,554 @@ RAG_COLORS = {
     "Gray": RGBColor(128, 128, 128)
 }
 
+# Table rows as entered in the form (slotted: compact, and cells are plain attribute reads)
+@dataclass(slots=True)
+class Milestone:
+    name: str
+    baseline: str
+    target: str
+    status: str
+
+@dataclass(slots=True)
+class Objective:
+    objective: str
+    actual: str
+    deviation: str
+
+@dataclass(slots=True)
+class Deliverable:
+    name: str
+    date: str
+
+@dataclass(slots=True)
+class OpenItem:
+    task: str
+    date: str
+    owner: str
+    steps: str
+
 # -------------------------
 # Utilities (enhanced with more guards)
 # -------------------------
 def is_valid_date(d: str) -> bool:
     if not d or d == "??":
         return True  # Allow ?? as per template
-    return bool(DATE_RE.match(d))
-
-def download_image_to_bytes(url: Optional[str]) -> Optional[io.BytesIO]:
-    if not url:
-        return None
-    try:
-        r = requests.get(url, timeout=10)
+    # Fixed-shape DD/MM/YYYY check without the regex engine; isdecimal() accepts exactly what \d did.
+    # Once both slashes are in place, dropping them leaves the 8 digits for a single isdecimal() call
+    return len(d) == 10 and d[2] == "/" == d[5] and d.replace("/", "", 2).isdecimal()
+
+@st.cache_data(show_spinner=False)
+def split_csv(text: str) -> List[str]:
+    # Only re-split when the text area actually changed, not on every rerun
+    # Each item is stripped once (map(str.strip) runs in C) rather than twice
+    return [s for s in map(str.strip, text.split(",")) if s]
+
+@st.cache_resource(show_spinner=False)
+def http_session() -> requests.Session:
+    # One keep-alive pool for the whole server; a module-level Session would be rebuilt on every rerun
+    session = requests.Session()
+    # Identify the app; image hosts like Wikimedia throttle or refuse the generic python-requests agent
+    session.headers["User-Agent"] = "Zscaler-deck-generator/1.0"
+    return session
+
+@st.cache_resource(show_spinner=False)
+def image_validators() -> dict:
+    # url -> (conditional request headers, body) from the last 200, so a re-fetch after the
+    # data cache expires can be answered with a 304 instead of the whole image
+    return {}
+
+@st.cache_resource(show_spinner=False)
+def downloaded_images() -> dict:
+    # url -> body of its last successful download, for callers that must never wait on the network
+    return {}
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_image_bytes(url: str) -> bytes:
+    # Cached per URL across reruns; raises on failure so errors are never cached.
+    # Streamed in chunks so the body is never held twice (r.content + the copy).
+    known = image_validators().get(url)
+    with http_session().get(url, headers=known and known[0], stream=True, timeout=10) as r:
+        if known and r.status_code == 304:
+            return known[1]
         r.raise_for_status()
-        return io.BytesIO(r.content)
+        r.raw.decode_content = True  # undo any gzip/deflate transfer encoding
+        buf = io.BytesIO()
+        shutil.copyfileobj(r.raw, buf, length=64 * 1024)
+        data = buf.getvalue()
+        validators = {}
+        if "ETag" in r.headers:
+            validators["If-None-Match"] = r.headers["ETag"]
+        if "Last-Modified" in r.headers:
+            validators["If-Modified-Since"] = r.headers["Last-Modified"]
+        if validators:
+            image_validators()[url] = (validators, data)
+        downloaded_images()[url] = data
+        return data
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_image_or_none(url: str) -> Optional[bytes]:
+    # Failures are remembered for 5 minutes, so a dead URL doesn't cost its full timeout on every Generate
+    try:
+        return fetch_image_bytes(url)
     except Exception:
-        st.warning(f"Couldn't download image from {url}")
         return None
 
-def set_font_run(run, name: str = FONT_NAME, size: Pt = SIZE_BODY, bold: bool = False, color: RGBColor = COLOR_BLACK):
-    try:
-        run.font.name = name
-        run.font.size = size
-        run.font.bold = bold
-        run.font.color.rgb = color
-        if hasattr(run, "_element"):
-            run._element.rPr.rFonts.set(qn("a:ea"), name)
-    except Exception:
-        pass
+def image_from_future(future, url: str) -> Optional[bytes]:
+    # Resolve a background fetch_image_or_none() call; warnings must be issued on the script thread
+    data = future.result()
+    if data is None:
+        st.warning(f"Couldn't download image from {url}")
+    return data
+
+def edit_table(defaults: list, row_type, columns: dict, key: str) -> list:
+    # One data_editor per form table instead of a text widget per cell, so a rerun diffs one
+    # widget rather than up to 28. columns maps row field -> column header (or a column config);
+    # cleared cells read as "". Cells are single-line, so the former text-area fields can't hold line breaks.
+    fields = list(columns)
+    edited = st.data_editor([dict(zip(fields, row)) for row in defaults], column_config=columns, num_rows="fixed", hide_index=True, key=key)
+    return [row_type(*(row[f] or "" for f in fields)) for row in edited]
+
+def sidebar_logo():
+    # Raw bytes of a logo the deck fetches already downloaded; until then the browser loads the URL.
+    # Never fetched here, so a slow or dead logo host can't block a rerun.
+    return downloaded_images().get(LOGO_URL) or LOGO_URL
+
+@lru_cache(maxsize=None)
+def rpr_xml(size: Pt = SIZE_BODY, bold: bool = False, color: RGBColor = COLOR_BLACK, name: str = FONT_NAME) -> str:
+    # Run formatting as <a:rPr> markup; the deck only uses a handful of styles, so each
+    # (size, bold, color) string, hex conversion included, is formatted once
+    return (
+        f'<a:rPr sz="{size.centipoints}" b="{int(bold)}">'
+        f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+        f'<a:latin typeface="{name}"/><a:ea typeface="{name}"/></a:rPr>'
+    )
+
+# Control characters XML 1.0 can't carry, written as python-pptx's run text setter does ("\x07" -> "_x0007_").
+# Tab and newline are legal; "\v" never reaches here, the builders turn it into a line break first.
+_CTRL_ESCAPES = {c: f"_x{c:04X}_" for c in (*range(0x09), *range(0x0B, 0x20))}
+
+def xml_text(line: str) -> str:
+    # Body of an <a:t>: control characters escaped like python-pptx, then the XML specials
+    return escape(line.translate(_CTRL_ESCAPES))
+
+def table_cell_xml(text: str, rpr: str, fill: Optional[RGBColor] = None) -> str:
+    # One <a:tc>; every line becomes a paragraph carrying the run formatting, and a vertical tab
+    # a line break inside it (python-pptx's text frame semantics)
+    paras = "".join(
+        "<a:p>" + "<a:br/>".join(f"<a:r>{rpr}<a:t>{xml_text(part)}</a:t></a:r>" for part in line.split("\v")) + "</a:p>"
+        for line in text.split("\n")
+    )
+    tc_pr = f'<a:tcPr><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></a:tcPr>' if fill else "<a:tcPr/>"
+    return f"<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paras}</a:txBody>{tc_pr}</a:tc>"
+
+# Auto-fit textbox <p:sp>; same markup python-pptx writes for add_textbox. id/name are filled in by add_sp_xml.
+_TEXTBOX_SP_XML = (
+    f'<p:sp {nsdecls("p", "a")}><p:nvSpPr><p:cNvPr id="0" name=""/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>{paras}</p:txBody></p:sp>'
+)
+
+def para_xml(text: str, rpr: str, algn: str = "l", space_before=None) -> str:
+    # One <a:p>; each line is its own formatted run. A vertical tab (PowerPoint/Word's soft line
+    # break, common in pasted text) is a line break too, as with python-pptx's paragraph text setter.
+    spc = f'<a:spcBef><a:spcPts val="{space_before.centipoints}"/></a:spcBef>' if space_before is not None else ""
+    ppr = f'<a:pPr algn="{algn}">{spc}</a:pPr>' if spc else f'<a:pPr algn="{algn}"/>'
+    runs = "<a:br/>".join(f"<a:r>{rpr}<a:t>{xml_text(line)}</a:t></a:r>" for line in text.replace("\v", "\n").split("\n"))
+    return f"<a:p>{ppr}{runs}</a:p>"
+
+def textbox_sp_xml(left, top, width, height, paras: str) -> str:
+    return _TEXTBOX_SP_XML.format(x=left, y=top, cx=width, cy=height, paras=paras)
+
+# Filled rounded rectangle <p:sp> as python-pptx's add_shape + fill.solid() leave it, fill baked in.
+# The name attribute carries the shape kind; add_sp/add_sps append the shape number (unnamed = TextBox).
+_BOX_SP_XML = (
+    f'<p:sp {nsdecls("p", "a")}><p:nvSpPr><p:cNvPr id="0" name="Rounded Rectangle"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm><a:prstGeom prst="roundRect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef><a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+
+def add_sp(slide, sp):
+    # Drop a prebuilt <p:sp> straight into the shape tree with the next free shape id
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    cNvPr = sp.nvSpPr.cNvPr
+    cNvPr.id = shape_id
+    cNvPr.name = f"{cNvPr.name or 'TextBox'} {shape_id - 1}"
+    shapes._spTree.insert_element_before(sp, "p:extLst")
+
+def add_sp_xml(slide, sp_xml: str):
+    add_sp(slide, parse_xml(sp_xml))
+
+def add_sps(slide, sps: list):
+    # Several prebuilt <p:sp> in one go: ids are counted up from a single shape-id scan
+    # (python-pptx rescans every id in the slide for each shape) and the tree is spliced once
+    shapes = slide.shapes
+    spTree = shapes._spTree  # resolved once, used for the id scan and the splice
+    shape_id = shapes._next_shape_id
+    for i, sp in enumerate(sps, shape_id):
+        cNvPr = sp.nvSpPr.cNvPr
+        cNvPr.id = i
+        cNvPr.name = f"{cNvPr.name or 'TextBox'} {i - 1}"
+    ext_lst = spTree.find(qn("p:extLst"))
+    if ext_lst is None:
+        spTree.extend(sps)
+    else:
+        for sp in sps:
+            ext_lst.addprevious(sp)
+
+# Text shapes of the title/bullet slides depend only on their inputs, so they are parsed once and kept
+# as prototypes across Generate clicks and reruns (constant slides like "Technical Summary" always hit).
+# Callers add a deepcopy: shape ids are stamped per deck, and the prototypes must stay untouched.
+@st.cache_resource(show_spinner=False, max_entries=64)
+def title_slide_sps(title_text: str, subtitle_text: str = "", date_text: str = "") -> list:
+    sps = [textbox_sp_xml(MARGIN_LEFT, _IN[1.0], _IN[8.0], _IN[1.0], para_xml(title_text or "", rpr_xml(SIZE_TITLE, True, COLOR_WHITE)))]
+    if subtitle_text:
+        sps.append(textbox_sp_xml(MARGIN_LEFT, _IN[2.1], _IN[8.0], _IN[0.5], para_xml(subtitle_text.upper(), rpr_xml(SIZE_SUBTITLE, color=COLOR_WHITE))))
+        # Add red lowercase customer below
+        sps.append(textbox_sp_xml(MARGIN_LEFT, _IN[3.1], _IN[8.0], _IN[0.5], para_xml(subtitle_text.lower(), rpr_xml(SIZE_SUBTITLE, color=COLOR_THREAT_RED))))
+    if date_text:
+        sps.append(textbox_sp_xml(MARGIN_LEFT, _IN[2.6], _IN[8.0], _IN[0.5], para_xml(date_text, rpr_xml(SIZE_BODY, color=COLOR_WHITE))))
+    return [parse_xml(sp) for sp in sps]
+
+def stacked_paras_xml(lines, rpr: str, pitch) -> str:
+    # Paragraphs spaced to the pitch the old one-textbox-per-line layouts used:
+    # gap = pitch - one line (~1.2x the font size)
+    gap = Emu(pitch - SIZE_BODY * 6 // 5)
+    return "".join(para_xml(line, rpr, space_before=gap if i else None) for i, line in enumerate(lines))
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def bullet_slide_sps(title_text: str, bullets: tuple) -> list:
+    paras = stacked_paras_xml(["- " + b for b in bullets], rpr_xml(SIZE_BODY), _IN[0.5])
+    return [
+        parse_xml(textbox_sp_xml(MARGIN_LEFT, _IN[0.45], _IN[8.0], _IN[0.5], para_xml(title_text or "", rpr_xml(SIZE_SLIDE_TITLE, True, COLOR_NAVY)))),
+        parse_xml(textbox_sp_xml(MARGIN_LEFT + _IN[0.5], _IN[1.2], _IN[7.5], _IN[0.5] * len(bullets), paras)),
+    ]
+
+def add_item_list(slide, left, top, items: List[str]):
+    # One textbox per Next Steps column rather than one per item
+    if items:
+        add_sp_xml(slide, textbox_sp_xml(left, top, _BULLET_W, _ROW_STEP * len(items), stacked_paras_xml(items, rpr_xml(SIZE_BODY), _ROW_STEP)))
+
+def add_textbox(slide, left, top, width, height, text: str, size=SIZE_BODY, bold=False, color=COLOR_BLACK, algn: str = "l"):
+    # Whole shape written as one parsed <p:sp> instead of add_textbox + clear + text + font setters
+    add_sp_xml(slide, textbox_sp_xml(left, top, width, height, para_xml(text or "", rpr_xml(size, bold, color), algn)))
+
+def add_picture_bytes(slide, data: bytes, left, top, width, height, image_parts: dict):
+    # First use packages the image; later slides only relate the same part instead of
+    # re-reading/re-hashing the stream. Keyed on the bytes object (its hash is cached).
+    image_part = image_parts.get(data)
+    if image_part is None:
+        image_part, rId = slide.part.get_or_add_image_part(io.BytesIO(data))
+        image_parts[data] = image_part
+    else:
+        rId = slide.part.relate_to(image_part, RT.IMAGE)
+    # The size is always given, so add the <p:pic> directly: _add_pic_from_image_part would still
+    # call image_part.scale(), which opens the blob with PIL twice (pixel size and DPI) per picture.
+    # _spTree.add_pic/_next_shape_id are python-pptx internals; requirements.txt caps the version they were checked on.
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    return shapes._spTree.add_pic(shape_id, f"Picture {shape_id - 1}", image_part.desc, rId, left, top, width, height)
+
+# PROSERVE label and footer are the same on every slide: parsed once, then each slide gets a deepcopy
+@st.cache_resource(show_spinner=False)
+def branding_sps(slide_height: int) -> list:
+    logo_top = MARGIN_TOP // 2
+    proserve_left = MARGIN_LEFT + _LOGO_W + _IN[0.1]  # next to the logo
+    footer_top = slide_height - FOOTER_HEIGHT
+    return [
+        parse_xml(textbox_sp_xml(proserve_left, logo_top, _IN[2.5], _LOGO_H, para_xml("PROSERVE", rpr_xml(SIZE_BRAND, True, COLOR_WHITE)))),
+        # Footer (exact text from template)
+        parse_xml(textbox_sp_xml(MARGIN_LEFT, footer_top, _IN[4.0], FOOTER_HEIGHT, para_xml("Zscaler, Inc. All rights reserved. © 2025", rpr_xml(SIZE_FOOTER, color=COLOR_NAVY)))),
+    ]
+
+# Slide number box, kept per (slide size, number) like the chrome above, so its geometry and markup
+# are worked out once rather than on every slide of every deck
+@st.cache_resource(show_spinner=False)
+def slide_number_sp(slide_size: tuple, slide_num: int):
+    slide_width, slide_height = slide_size
+    return parse_xml(textbox_sp_xml(slide_width - _IN[1.0], slide_height - FOOTER_HEIGHT, _IN[0.8], FOOTER_HEIGHT, para_xml(str(slide_num), rpr_xml(SIZE_FOOTER, color=COLOR_NAVY), "r")))
+
+def apply_template_branding(slide_size: tuple, slide, slide_num: int, logo_bytes: Optional[bytes], image_parts: dict) -> Optional[bytes]:
+    # Returns the logo for the next slide: None once adding it failed, so the warning shows once per deck
+    if logo_bytes:
+        try:
+            add_picture_bytes(slide, logo_bytes, MARGIN_LEFT, MARGIN_TOP // 2, _LOGO_W, _LOGO_H, image_parts)
+        except Exception as e:
+            st.warning(f"Couldn't add the logo to the slides: {e}")
+            logo_bytes = None
+    # Slide size is read once per deck (slide_size), not through the presentation XML per slide
+    add_sps(slide, [deepcopy(sp) for sp in (*branding_sps(slide_size[1]), slide_number_sp(slide_size, slide_num))])
+    return logo_bytes
+
+def add_slide_with_background(prs: Presentation, bg_bytes: Optional[bytes], slide_size: tuple, image_parts: dict):
+    # Blank. The stock template's other layouts stay in the deck so "New Slide" in PowerPoint still offers them
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    if bg_bytes:
+        # Same per-deck part as every other slide's background, packaged once
+        add_picture_bytes(slide, bg_bytes, 0, 0, *slide_size, image_parts)
+    return slide
+
+# Slide builders fill in a slide that build_deck has already added (with its background)
+# Title Slide (tweaked positions, white text)
+def create_title_slide(slide, title_text: str, subtitle_text: str = "", date_text: str = ""):
+    add_sps(slide, [deepcopy(sp) for sp in title_slide_sps(title_text, subtitle_text, date_text)])
+    return slide
 
-def add_textbox(slide, left, top, width, height, text: str, size=SIZE_BODY, bold=False, color=COLOR_BLACK, align=PP_ALIGN.LEFT, auto_size=False):
+# Bullet Slide (same, but added image support)
+def create_bullet_slide(slide, title_text: str, bullets: List[str]):
+    add_sps(slide, [deepcopy(sp) for sp in bullet_slide_sps(title_text, tuple(bullets))])
+    return slide
+
+# Table Slide (enhanced with RAG colors, exact widths, and run guards to fix IndexError)
+def create_table_slide(slide, width: int, title_text: str, headers: List[str], rows: List, top: int = _IN[1.2], height: int = _IN[4.0], col_widths: List = None, keys: Optional[List[str]] = None, skip_blank: bool = False):
+    add_textbox(slide, MARGIN_LEFT, _IN[0.45], _IN[8.0], _IN[0.5], title_text, SIZE_SLIDE_TITLE, True, COLOR_NAVY)
+    left = MARGIN_LEFT
+    cols = len(headers)
+    # With keys, rows are the form's row objects; attrgetter pulls a row's cells in one C call
+    # (tables always have 2+ columns, so it returns a tuple)
+    get_cells = attrgetter(*keys) if keys else None
+    if skip_blank:
+        # Rows left entirely blank in the form aren't built; an all-blank table keeps one placeholder row
+        # Cells are read the way the body loop reads them, and needn't be str (e.g. rollout counts)
+        rows = [row for row in rows if any(str(v).strip() for v in (row if get_cells is None else get_cells(row)))]
+        if not rows:
+            rows, get_cells = [("—",) * cols], None
+    n_rows = len(rows) + 1
+    graphic_frame = slide.shapes.add_table(n_rows, cols, left, top, width, height)
+    # Set widths (EMU, exact from template) - ints are EMU, floats are inches
+    if not col_widths:
+        col_widths = [width // cols] * cols
+    widths = [Inches(w) if isinstance(w, float) else w for w in col_widths]
+    # Build the whole <a:tbl> (grid, fills, run formatting) as one string and parse it once,
+    # instead of per-cell text/fill/font proxy writes. Row heights split like python-pptx does.
+    row_h = height // n_rows
+    heights = [row_h] * (n_rows - 1) + [height - (n_rows - 1) * row_h]
+    header_rpr = rpr_xml(SIZE_HEADER, bold=True, color=COLOR_WHITE)
+    body_rpr = rpr_xml(SIZE_BODY)
+    last_col = cols - 1
+    xml = [f'<a:tbl {nsdecls("a")}><a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{TABLE_STYLE_ID}</a:tableStyleId></a:tblPr><a:tblGrid>']
+    xml += [f'<a:gridCol w="{w}"/>' for w in widths]
+    xml.append(f'</a:tblGrid><a:tr h="{heights[0]}">')
+    xml += [table_cell_xml(str(h), header_rpr, COLOR_NAVY) for h in headers]
+    xml.append("</a:tr>")
+    # Rows (RAG fill on the status column, light gray banding on even rows)
+    for r, row in enumerate(rows, 1):
+        xml.append(f'<a:tr h="{heights[r]}">')
+        # Banding is per row; only the status column can override it
+        row_fill = COLOR_LIGHT_GRAY if r % 2 == 0 else None
+        xml += [
+            table_cell_xml(str(val), body_rpr, RAG_COLORS.get(val, row_fill) if c == last_col else row_fill)
+            for c, val in enumerate(row if get_cells is None else get_cells(row))
+        ]
+        xml.append("</a:tr>")
+    xml.append("</a:tbl>")
+    tbl = graphic_frame.table._tbl
+    tbl.getparent().replace(tbl, parse_xml("".join(xml)))
+    graphic_frame.width = Emu(sum(widths))
+    return slide
+
+# Next Steps Slide (with pointer)
+def create_next_steps_slide(slide, short_term: List[str], long_term: List[str]):
+    add_textbox(slide, MARGIN_LEFT, _IN[0.45], _IN[8.0], _IN[0.5], "Recommended Next Steps", SIZE_SLIDE_TITLE, True, COLOR_NAVY)
+    # Short Term
+    add_textbox(slide, MARGIN_LEFT, _IN[1.2], _IN[4.0], _IN[0.4], "Short Term Activities", SIZE_HEADER, True)
+    add_item_list(slide, _BULLET_LEFT, _IN[1.6], short_term)
+    # Long Term
+    add_textbox(slide, _IN[5.5], _IN[1.2], _IN[4.0], _IN[0.4], "Long Term Activities", SIZE_HEADER, True)
+    add_item_list(slide, _LONG_LEFT, _IN[1.6], long_term)
+    # Add activities pointer
+    pointer_top = _IN[1.6] + len(long_term) * _ROW_STEP + _IN[0.5]
+    add_textbox(slide, MARGIN_LEFT, pointer_top, _IN[9.0], _IN[0.5], "Next Short- and Long-Term Activities\nIf additional resources and/or expertise are required to complete any of the recommendations above, customer should consider engaging Zscaler Professional Services to assist with this effort.", SIZE_SMALL)
+    return slide
+
+# ZIA Diagram (expanded to match template exactly, with more elements)
+def create_zia_diagram_slide(slide, idp, auth_type, prov_type, tunnel_type, deploy_system, windows_num, geo_locations, ssl_policies, url_policies, cloud_policies, fw_policies):
+    from pptx.enum.shapes import MSO_CONNECTOR  # only the diagram draws connectors
+    add_textbox(slide, MARGIN_LEFT, _IN[0.45], _IN[8.0], _IN[0.5], "Deployed ZIA Architecture", SIZE_SLIDE_TITLE, True, COLOR_NAVY)
+    # Boxes and labels (fine-tuned positions)
+    box_w = _IN[2.5]
+    box_h = _IN[1.0]
+    left1 = _IN[0.5]
+    top1 = _IN[1.2]
+    left2 = left1 + box_w + _IN[0.5]
+    left3 = left2 + box_w + _IN[0.5]
+    top2 = top1 + box_h + _IN[0.5]
+    top3 = top2 + box_h + _IN[0.5]
+    # (left, top, fill, label, bold, text color) - same order as the template
+    boxes = [
+        (left1, top1, COLOR_LIGHT_GRAY, "User authentication and provisioning", False, COLOR_BLACK),
+        (left2, top1, COLOR_BRIGHT_BLUE, "Central Authority", True, COLOR_WHITE),
+        (left3, top1, COLOR_LIGHT_GRAY, "Public Service Edges", False, COLOR_BLACK),
+        (left1, top2, COLOR_LIGHT_GRAY, "Workforce (Region-X)\nOn | Off - net", False, COLOR_BLACK),
+        (left2, top2, COLOR_LIGHT_GRAY, "Z-Tunnels", False, COLOR_BLACK),
+        (left3, top2, COLOR_LIGHT_GRAY, "SSL Inspection", False, COLOR_BLACK),
+        (left1, top3, COLOR_LIGHT_GRAY, "Workforce (Region-Y)\nOn | Off - net", False, COLOR_BLACK),
+        (left3, top3, COLOR_LIGHT_GRAY, "Admin Console", False, COLOR_BLACK),
+        (left2, top3, COLOR_LIGHT_GRAY, "Logging", False, COLOR_BLACK),
+    ]
+    # Boxes, their labels and the numbers all go in with one add_sps (one shape-id scan for 23 shapes)
+    pad_x = _IN[0.2]
+    pad_y = _IN[0.3]
+    label_w = box_w - _IN[0.4]
+    label_h = box_h - _IN[0.6]
+    sps = []
+    for left, top, fill, label, bold, color in boxes:
+        sps.append(parse_xml(_BOX_SP_XML.format(x=left, y=top, cx=box_w, cy=box_h, fill=fill)))
+        sps.append(parse_xml(textbox_sp_xml(left + pad_x, top + pad_y, label_w, label_h, para_xml(label, rpr_xml(SIZE_SMALL, bold, color), "ctr"))))
+    # Numbers (1-5 from template)
+    num_size = _IN[0.3]
+    num_rpr = rpr_xml(SIZE_SMALL)
+    for left, top, num in ((left1, top1, "1"), (left2, top1, "3"), (left3, top1, "4"), (left1, top2, "2"), (left3, top3, "5")):
+        sps.append(parse_xml(textbox_sp_xml(left + box_w // 2, top - num_size, num_size, num_size, para_xml(num, num_rpr))))
+    add_sps(slide, sps)
+    # Connectors (arrows for Z-Tunnels, etc.). Midpoints use // so the xfrm gets integer EMU;
+    # box_h/2 wrote "1554480.0"-style coordinates, which aren't valid OOXML
+    mid_y = top1 + box_h // 2
+    mid_x1 = left1 + box_w // 2
+    mid_x3 = left3 + box_w // 2
     try:
-        txBox = slide.shapes.add_textbox(left, top, width, height)
-        tf = txBox.text_frame
-        if auto_size:
-            tf.word_wrap = True
-            tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-        tf.clear()
-        p = tf.add_paragraph() if len(tf.paragraphs) == 0 else tf.paragraphs[0]  # Guard
-        p.text = text or ""
-        p.alignment = align
-        if not p.runs:
-            run = p.add_run()
-        else:
-            run = p.runs[0]
-        set_font_run(run, size=size, bold=bold, color=color)
-        return txBox
+        conn1 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left1 + box_w, mid_y, left2, mid_y)
+        conn1.line.color.rgb = COLOR_BLACK
+        conn2 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left2 + box_w, mid_y, left3, mid_y)
+        conn2.line.color.rgb = COLOR_BLACK
+        conn3 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, mid_x1, top1 + box_h, mid_x1, top2)
+        conn3.line.color.rgb = COLOR_BLACK
+        # Add more for full template
+        conn4 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, mid_x3, top1 + box_h, mid_x3, top2)
+        conn4.line.color.rgb = COLOR_BLACK
+        conn5 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, mid_x1, top2 + box_h, mid_x1, top3)
+        conn5.line.color.rgb = COLOR_BLACK
     except Exception:
-        st.warning("Failed to add textbox")
-        return None
+        pass
+    # Key facts (as table-like text)
+    key_top = _IN[1.2]
+    key_left = _IN[8.0]
+    key_text = f"Identity Provider: {idp}\nAuthentication Type: {auth_type}\nProvisioning: {prov_type}\n\nTunnel Type: {tunnel_type}\nDeployment System: {deploy_system}\nNumber of Windows and MacOS Devices: {windows_num} Windows\n98 MacOS Devices\nGeo Locations: {geo_locations}\n\nPolicy Deployment\nSSL Inspection Policies: {ssl_policies}\nURL Filtering Policies: {url_policies}\nCloud App Control Policies: {cloud_policies}\nFirewall Policies: {fw_policies}"
+    add_textbox(slide, key_left, key_top, _IN[4.0], _IN[4.0], key_text, SIZE_SMALL)
+    # Add overview pointer
+    pointer_top = top3 + box_h + _IN[0.5]
+    add_textbox(slide, MARGIN_LEFT, pointer_top, _IN[9.0], _IN[0.5], "An overview of the deployed architecture and key facts - diagram stays generic (custom diagram will be in design document) \nNumbers on the diagram help to orient the conversation", SIZE_SMALL)
+    return slide
 
-def apply_template_branding(prs: Presentation, slide, slide_num: int, logo_bytes: Optional[io.BytesIO]):
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_deck(
+    logo_bytes: Optional[bytes], bg_bytes: Optional[bytes], *,
+    customer_name, today_date, project_start, project_end, project_summary_text, milestones_data,
+    pilot_target, pilot_current, pilot_completion, pilot_status, prod_target, prod_current,
+    prod_completion, prod_status, objectives_data, deliverables_data, idp, auth_type,
+    prov_type, tunnel_type, deploy_system, windows_num, geo_locations, ssl_policies,
+    url_policies, cloud_policies, fw_policies, open_items_data, short_term, long_term,
+    pm_name, consultant_name, primary_contact, secondary_contact,
+) -> bytes:
+    # The deck is a pure function of the form values and the two images, so clicking Generate again
+    # with an unchanged form serves the cached .pptx instead of rebuilding every slide
+    prs = Presentation()
     slide_width = prs.slide_width
     slide_height = prs.slide_height
-    logo_w = Inches(1.5)  # Tweaked for template
-    logo_h = Inches(0.4)
-    logo_left = MARGIN_LEFT
-    logo_top = MARGIN_TOP / 2
-    if logo_bytes:
-        try:
-            slide.shapes.add_picture(logo_bytes, logo_left, logo_top, logo_w, logo_h)
-        except Exception:
-            pass
-    # Add "PROSERVE" text next to logo
-    proserve_left = logo_left + logo_w + Inches(0.1)
-    add_textbox(slide, proserve_left, logo_top, Inches(2.5), logo_h, "PROSERVE", size=Pt(24), bold=True, color=COLOR_WHITE)
-    # Footer (exact text from template)
-    footer_left = MARGIN_LEFT
-    footer_top = slide_height - FOOTER_HEIGHT
-    footer_w = Inches(4.0)
-    footer_h = FOOTER_HEIGHT
-    add_textbox(slide, footer_left, footer_top, footer_w, footer_h, "Zscaler, Inc. All rights reserved. © 2025", size=SIZE_FOOTER, color=COLOR_NAVY)
-    # Slide number
-    add_textbox(slide, slide_width - Inches(1.0), footer_top, Inches(0.8), footer_h, str(slide_num), size=SIZE_FOOTER, color=COLOR_NAVY, align=PP_ALIGN.RIGHT)
-
-def add_slide_with_background(prs: Presentation, bg_bytes: Optional[io.BytesIO]):
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
-    if bg_bytes:
-        slide.shapes.add_picture(bg_bytes, 0, 0, prs.slide_width, prs.slide_height)
-    return slide
+    slide_size = (slide_width, slide_height)
+    content_width = slide_width - 2 * MARGIN_LEFT  # tables span the slide between the margins
+    image_parts = {}  # image bytes -> ImagePart, shared by every slide of this deck
+    # Every slide starts the same way; the module-level builders then fill it in
+    new_slide = partial(add_slide_with_background, prs, bg_bytes, slide_size, image_parts)
+
+    # Build Slides (added missing ones: rollout, objectives, who/what, RAG key)
+
+    # Slide 1: Title
+    create_title_slide(new_slide(), "Professional Services Transition Meeting", customer_name, today_date)
+
+    # Slide 2: Agenda
+    create_bullet_slide(new_slide(), "Meeting Agenda", ["Project Summary", "Technical Summary", "Recommended Next Steps"])
+
+    # Slide 3: Project Summary Title
+    create_title_slide(new_slide(), "Project Summary")
+
+    # Slide 4: Final Project Status Report (added who/what box, RAG key)
+    slide4 = new_slide()
+    add_textbox(slide4, MARGIN_LEFT, _IN[0.45], _IN[8.0], _IN[0.5], f"Final Project Status Report – {customer_name}", SIZE_SLIDE_TITLE, True, COLOR_NAVY)
+    add_textbox(slide4, MARGIN_LEFT, _IN[1.2], _IN[8.0], _IN[0.4], "Project Summary", SIZE_HEADER, True)
+    add_textbox(slide4, MARGIN_LEFT, _IN[1.7], _IN[8.0], _IN[1.0], project_summary_text, SIZE_BODY)
+    # Dates
+    add_textbox(slide4, MARGIN_LEFT, _IN[2.5], _IN[4.0], _IN[1.0], f"Today's Date: {today_date} | Start: {project_start} | End: {project_end}", SIZE_BODY)
+    # Who/What/When/Why box (new)
+    who_text = "Who: External & Internal Project Team\nWhat: Project Status Report\nWhen: Weekly\nWhy: Keeps stakeholders informed on a weekly basis on critical aspects of the project such as scope, schedule, risks, issues, and next steps. \nMandatory: Yes (all projects)"
+    add_textbox(slide4, _IN[6.0], _IN[3.0], _IN[4.0], _IN[2.0], who_text, SIZE_SMALL)
+    # RAG Key (new table-like)
+    rag_text = "RAG Status Key:\nRed - Not On Track\nAmber - At Risk\nGreen - On Track\nBlue - Complete\nGray - Not Started"
+    add_textbox(slide4, _IN[6.0], _IN[5.5], _IN[4.0], _IN[1.5], rag_text, SIZE_SMALL)
+
+    # Slide 5: Milestones Table
+    headers = ["Milestone", "Baseline Date", "Target Completion Date", "Status"]
+    create_table_slide(new_slide(), content_width, "Milestones", headers, milestones_data, keys=["name", "baseline", "target", "status"], col_widths=_MILESTONE_COLS)
+
+    # Slide 6: User Rollout Table (new)
+    rollout_headers = ["Milestone", "Target Users", "Current Users", "Target Completion", "Status"]
+    rollout_rows = [
+        ["Pilot", f"{pilot_target}", f"{pilot_current}", pilot_completion, pilot_status],
+        ["Production", f"{prod_target}", f"{prod_current}", prod_completion, prod_status]
+    ]
+    create_table_slide(new_slide(), content_width, "User Rollout Roadmap", rollout_headers, rollout_rows, height=_IN[1.5], col_widths=_ROLLOUT_COLS)
+
+    # Slide 7: Project Status (Objectives Table, new)
+    obj_headers = ["Planned Project Objective (Target)", "Actual Project Result (Actual)", "Deviation/ Cause"]
+    create_table_slide(new_slide(), content_width, "Project Status", obj_headers, objectives_data, keys=["objective", "actual", "deviation"], height=_IN[2.0], col_widths=_OBJ_COLS)
+
+    # Slide 8: Deliverables Table (aligned)
+    del_headers = ["Deliverable", "Date delivered"]
+    create_table_slide(new_slide(), content_width, "Deliverables", del_headers, deliverables_data, keys=["name", "date"], height=_IN[2.4], col_widths=_DEL_COLS, skip_blank=True)
+
+    # Slide 9: Technical Summary Title
+    create_title_slide(new_slide(), "Technical Summary")
+
+    # Slide 10: ZIA Architecture
+    create_zia_diagram_slide(
+        new_slide(), idp, auth_type, prov_type, tunnel_type, deploy_system, windows_num, geo_locations,
+        ssl_policies, url_policies, cloud_policies, fw_policies,
+    )
+
+    # Slide 11: Open Items Table
+    open_headers = ["Task/ Description", "Date", "Owner", "Transition Plan/ Next Steps"]
+    create_table_slide(new_slide(), content_width, "Open Items", open_headers, open_items_data, keys=["task", "date", "owner", "steps"], col_widths=_OPEN_COLS, skip_blank=True)
+
+    # Slide 12: Recommended Next Steps (separate)
+    create_next_steps_slide(new_slide(), short_term, long_term)
+
+    # Slide 13: Thank You (separate)
+    slide13 = new_slide()
+    add_textbox(slide13, MARGIN_LEFT, _IN[1.0], _IN[8.0], _IN[0.5], "Thank you", SIZE_TITLE, True, COLOR_NAVY)
+    thank_lines = [
+        "Your feedback on our project and Professional Services team is important to us. ",
+        f"Project Manager: {pm_name}",
+        f"Consultant: {consultant_name}",
+        "",
+        "A short ~6 question survey on how your Professional Services team did will be automatically sent after the project has closed. The following people will receive the survey via email:",
+        f"Primary Contact: {primary_contact}",
+        f"Secondary Contact: {secondary_contact}",
+        "We appreciate any insights you can provide to help us improve our processes and ensure we provide the best possible service in future projects.",
+        "",
+        "We want to know!",
+    ]
+    # One paragraph per line, each carrying the body font (a single "\n"-joined run only formatted the first line)
+    body_rpr = rpr_xml(SIZE_BODY)
+    add_sp_xml(slide13, textbox_sp_xml(MARGIN_LEFT, _IN[2.0], _IN[8.0], _IN[3.0], "".join(para_xml(line, body_rpr) for line in thank_lines)))
+
+    # Chrome (logo, PROSERVE, footer, slide number) goes on in one pass once every slide exists;
+    # it is the last thing on each slide either way, so the XML is the same as branding per slide
+    for slide_num, slide in enumerate(prs.slides, 1):
+        logo_bytes = apply_template_branding(slide_size, slide, slide_num, logo_bytes, image_parts)
+
+    # Save
+    out = io.BytesIO()
+    prs.save(out)
+    return out.getvalue()
 
 # -------------------------
 # Streamlit UI (Made attractive: Columns, expanders, previews, images in expander)
 # -------------------------
 with st.sidebar:
-    st.image(LOGO_URL, width=200)
+    st.image(sidebar_logo(), width=200)
     st.header("Zscaler Deck Generator")
     st.markdown("Create customer transition decks fast! Matches template exactly.")
     st.markdown("**Steps:**\n1. Fill details.\n2. Upload images if needed.\n3. Preview.\n4. Generate & Download.")
@@ -206,15 +690,8 @@ milestone_defaults = [
     ("Production Rollout Complete", "19/09/2025", "??", ""),
     ("Final Design Accepted", "19/09/2025", "19/09/2025", ""),
 ]
-milestones_data = []
 with st.expander("Edit Milestones (7 rows)", expanded=True):
-    for i, default in enumerate(milestone_defaults):
-        c1, c2, c3, c4 = st.columns(4)
-        mn = c1.text_input(f"Name {i+1}", default[0])
-        mb = c2.text_input(f"Baseline {i+1}", default[1])
-        mt = c3.text_input(f"Target {i+1}", default[2])
-        ms = c4.text_input(f"Status {i+1}", default[3])
-        milestones_data.append({"name": mn, "baseline": mb, "target": mt, "status": ms})
+    milestones_data = edit_table(milestone_defaults, Milestone, {"name": "Name", "baseline": "Baseline", "target": "Target", "status": "Status"}, "milestones")
 
 # User Rollout (columns)
 st.header("User Rollout Roadmap")
@@ -237,13 +714,13 @@ objectives_defaults = [
     ("Complete user posture", "Users and devices are identified, and policies can be applied based on this criteria", "No deviations"),
     ("Comprehensive Web filtering", "Web filtering based on reputation and dynamic categorization rather than simply categories.", "No deviations"),
 ]
-objectives_data = []
 with st.expander("Edit Objectives (3 rows)", expanded=True):
-    for i, default in enumerate(objectives_defaults):
-        obj = st.text_area(f"Objective {i+1}", default[0], height=50)
-        act = st.text_area(f"Actual {i+1}", default[1], height=50)
-        dev = st.text_area(f"Deviation {i+1}", default[2], height=50)
-        objectives_data.append({"objective": obj, "actual": act, "deviation": dev})
+    # Wide columns stand in for the old text areas: the long descriptions stay readable, but on one line
+    objectives_data = edit_table(objectives_defaults, Objective, {
+        "objective": st.column_config.TextColumn("Objective", width="large"),
+        "actual": st.column_config.TextColumn("Actual", width="large"),
+        "deviation": st.column_config.TextColumn("Deviation", width="large"),
+    }, "objectives")
 
 # Deliverables (expander, defaults from template)
 st.header("Deliverables")
@@ -254,13 +731,8 @@ deliverables_defaults = [
     ("Initial & Final Design Document", "17/07/2025 – 17/09/2025"),
     ("Transition Meeting Slides", "19/09/2025"),
 ]
-deliverables_data = []
 with st.expander("Edit Deliverables (5 rows)", expanded=True):
-    for i, default in enumerate(deliverables_defaults):
-        c1, c2 = st.columns(2)
-        dn = c1.text_input(f"Name {i+1}", default[0])
-        dd = c2.text_input(f"Date {i+1}", default[1])
-        deliverables_data.append({"name": dn, "date": dd})
+    deliverables_data = edit_table(deliverables_defaults, Deliverable, {"name": "Name", "date": "Date"}, "deliverables")
 
 # Technical Summary (columns)
 st.header("Technical Summary")
@@ -292,21 +764,15 @@ open_defaults = [
     ("Configure DLP policies", "December 2025", "Pixartprinting", "Configure DLP policies to control sensitive data and avoid potential data leaks."),
     ("Deploy ZCC on Mobile devices", "January 2026", "Pixartprinting", "Expand the deployment of Zscaler Client Connector to Mobile devices."),
 ]
-open_items_data = []
 with st.expander("Edit Open Items (6 rows)", expanded=True):
-    for i, default in enumerate(open_defaults):
-        otask = st.text_input(f"Task {i+1}", default[0])
-        odate = st.text_input(f"Date {i+1}", default[1])
-        oowner = st.text_input(f"Owner {i+1}", default[2])
-        osteps = st.text_area(f"Steps {i+1}", default[3], height=60)
-        open_items_data.append({"task": otask, "date": odate, "owner": oowner, "steps": osteps})
+    open_items_data = edit_table(open_defaults, OpenItem, {"task": "Task", "date": "Date", "owner": "Owner", "steps": st.column_config.TextColumn("Steps", width="large")}, "open_items")
 
 # Next Steps
 st.header("Recommended Next Steps")
 short_term_input = st.text_area("Short Term (comma-separated)", value="Finish Production rollout.,Tighten Firewall policies.,Tighten Cloud App Control Policies.,Fine tune SSL Inspection policies.,Configure Role Based Access Control (RBAC).,Configure DLP policies.")
 long_term_input = st.text_area("Long Term (comma-separated)", value="Deploy ZCC on Mobile devices.,Consider an upgrade of Sandbox license to have better antimalware protection.,Consider an upgrade of the Firewall License to be able to apply policies based on user groups and network applications.,Adopt additional Zscaler solutions like Zscaler Private Access (ZPA) or Zscaler Digital experience (ZDX).,Consider using ZCC Client when the users are on-prem for a more consistent user experience.,Integrate ZIA with 3rd party SIEM.")
-short_term = [s.strip() for s in short_term_input.split(",") if s.strip()]
-long_term = [s.strip() for s in long_term_input.split(",") if s.strip()]
+short_term = split_csv(short_term_input)
+long_term = split_csv(long_term_input)
 
 # Contacts
 st.header("Contacts")
@@ -320,7 +786,7 @@ secondary_contact = st.text_input("Secondary Contact", value="Marco Sattier")
 if st.button("Preview Inputs"):
     st.subheader("Preview")
     st.write(f"**Customer:** {customer_name} | **Date:** {today_date} | **Summary:** {project_summary_text[:100]}...")
-    st.write(f"**Milestones:** {', '.join([m['name'] for m in milestones_data])}")
+    st.write(f"**Milestones:** {', '.join([m.name for m in milestones_data])}")
     st.write(f"**Rollout:** Pilot {pilot_current}/{pilot_target}, Prod {prod_current}/{prod_target}")
     st.write(f"**Objectives:** {len(objectives_data)} rows")
     st.write(f"**Deliverables:** {len(deliverables_data)} rows")
@@ -328,312 +794,54 @@ if st.button("Preview Inputs"):
     st.write(f"**Open Items:** {len(open_items_data)} rows")
     st.write(f"**Next Steps:** {len(short_term)} short, {len(long_term)} long")
 
+# Date inputs by label, checked together in one pass on Generate
+date_fields = (
+    ("Today's Date", today_date),
+    ("Project Start Date", project_start),
+    ("Project End Date", project_end),
+    ("Pilot Completion", pilot_completion),
+    ("Production Completion", prod_completion),
+)
+
 # Generation (with validation)
 if st.button("Generate & Download PPTX"):
     # Validation (enhanced)
     if not customer_name:
         st.error("Customer Name required!")
-    elif not all(is_valid_date(d) for d in [today_date, project_start, project_end, pilot_completion, prod_completion]):
-        st.error("Fix date formats (DD/MM/YYYY or ??)")
+    elif bad_dates := [f"{name} ({d})" for name, d in date_fields if not is_valid_date(d)]:
+        # List every bad field at once instead of stopping at the first
+        st.error(f"Fix date formats (DD/MM/YYYY or ??): {', '.join(bad_dates)}")
     else:
-        prs = Presentation()
-        slide_width = prs.slide_width
-        slide_height = prs.slide_height
-        logo_bytes = download_image_to_bytes(LOGO_URL) or download_image_to_bytes(FALLBACK_LOGO_URL)
-        bg_bytes = download_image_to_bytes(BG_URL) or generate_background()
-
-        # Helper: Title Slide (tweaked positions, white text)
-        def create_title_slide(title_text: str, subtitle_text: str = "", date_text: str = "", slide_num: int = 1):
-            slide = add_slide_with_background(prs, bg_bytes)
-            add_textbox(slide, MARGIN_LEFT, Inches(1.0), Inches(8.0), Inches(1.0), title_text, SIZE_TITLE, True, COLOR_WHITE)
-            if subtitle_text:
-                add_textbox(slide, MARGIN_LEFT, Inches(2.1), Inches(8.0), Inches(0.5), subtitle_text.upper(), SIZE_SUBTITLE, color=COLOR_WHITE)
-                # Add red lowercase customer below
-                add_textbox(slide, MARGIN_LEFT, Inches(3.1), Inches(8.0), Inches(0.5), subtitle_text.lower(), SIZE_SUBTITLE, color=COLOR_THREAT_RED)
-            if date_text:
-                add_textbox(slide, MARGIN_LEFT, Inches(2.6), Inches(8.0), Inches(0.5), date_text, SIZE_BODY, color=COLOR_WHITE)
-            apply_template_branding(prs, slide, slide_num, logo_bytes)
-            return slide
-
-        # Helper: Bullet Slide (same, but added image support)
-        def create_bullet_slide(title_text: str, bullets: List[str], slide_num: int = 1):
-            slide = add_slide_with_background(prs, bg_bytes)
-            add_textbox(slide, MARGIN_LEFT, Inches(0.45), Inches(8.0), Inches(0.5), title_text, SIZE_SLIDE_TITLE, True, COLOR_NAVY)
-            top = Inches(1.2)
-            for b in bullets:
-                add_textbox(slide, MARGIN_LEFT + Inches(0.5), top, Inches(7.5), Inches(0.4), "- " + b, SIZE_BODY)
-                top += Inches(0.5)
-            apply_template_branding(prs, slide, slide_num, logo_bytes)
-            return slide
-
-        # Helper: Table Slide (enhanced with RAG colors, exact widths, and run guards to fix IndexError)
-        def create_table_slide(title_text: str, headers: List[str], rows: List[List[str]], slide_num: int = 1, top_inch: float = 1.2, height_inch: float = 4.0, col_widths: List = None):
-            slide = add_slide_with_background(prs, bg_bytes)
-            add_textbox(slide, MARGIN_LEFT, Inches(0.45), Inches(8.0), Inches(0.5), title_text, SIZE_SLIDE_TITLE, True, COLOR_NAVY)
-            left = MARGIN_LEFT
-            top = Inches(top_inch)
-            width = slide_width - 2 * MARGIN_LEFT
-            height = Inches(height_inch)
-            cols = len(headers)
-            table = slide.shapes.add_table(len(rows) + 1, cols, left, top, width, height).table
-            # Set widths (EMU, exact from template) - handle Length or float
-            if not col_widths:
-                col_widths = [width / cols] * cols
-            for i, w in enumerate(col_widths):
-                if isinstance(w, Length):
-                    table.columns[i].width = w
-                else:
-                    table.columns[i].width = Emu(Inches(w))
-            # Headers (with run guard)
-            for i, h in enumerate(headers):
-                cell = table.cell(0, i)
-                cell.text = str(h)
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = COLOR_NAVY
-                p = cell.text_frame.paragraphs[0]
-                if not p.runs:
-                    p.add_run()
-                set_font_run(p.runs[0], size=SIZE_HEADER, bold=True, color=COLOR_WHITE)
-            # Rows (with RAG if status column, and run guard)
-            for r, row in enumerate(rows, 1):
-                for c, val in enumerate(row):
-                    cell = table.cell(r, c)
-                    cell.text = str(val)
-                    p = cell.text_frame.paragraphs[0]
-                    if not p.runs:
-                        p.add_run()
-                    set_font_run(p.runs[0], size=SIZE_BODY)
-                    if c == len(headers) - 1 and val in RAG_COLORS:  # Status column
-                        cell.fill.solid()
-                        cell.fill.fore_color.rgb = RAG_COLORS[val]
-                    elif r % 2 == 0:
-                        cell.fill.solid()
-                        cell.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            apply_template_branding(prs, slide, slide_num, logo_bytes)
-            return slide
-
-        # Helper: ZIA Diagram (expanded to match template exactly, with more elements)
-        def create_zia_diagram_slide(slide_num: int = 1):
-            slide = add_slide_with_background(prs, bg_bytes)
-            add_textbox(slide, MARGIN_LEFT, Inches(0.45), Inches(8.0), Inches(0.5), "Deployed ZIA Architecture", SIZE_SLIDE_TITLE, True, COLOR_NAVY)
-            # Boxes and labels (fine-tuned positions)
-            box_w = Inches(2.5)
-            box_h = Inches(1.0)
-            left1 = Inches(0.5)
-            top1 = Inches(1.2)
-            # User authentication box
-            shape1 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left1, top1, box_w, box_h)
-            shape1.fill.solid(); shape1.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left1 + Inches(0.2), top1 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "User authentication and provisioning", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # Central Authority
-            left2 = left1 + box_w + Inches(0.5)
-            shape2 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left2, top1, box_w, box_h)
-            shape2.fill.solid(); shape2.fill.fore_color.rgb = COLOR_BRIGHT_BLUE
-            add_textbox(slide, left2 + Inches(0.2), top1 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "Central Authority", SIZE_SMALL, bold=True, color=COLOR_WHITE, align=PP_ALIGN.CENTER)
-            # Public Service Edges
-            left3 = left2 + box_w + Inches(0.5)
-            shape3 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left3, top1, box_w, box_h)
-            shape3.fill.solid(); shape3.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left3 + Inches(0.2), top1 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "Public Service Edges", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # Workforce Region-X
-            top2 = top1 + box_h + Inches(0.5)
-            shape4 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left1, top2, box_w, box_h)
-            shape4.fill.solid(); shape4.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left1 + Inches(0.2), top2 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "Workforce (Region-X)\nOn | Off - net", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # Z-Tunnels box
-            shape5 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left2, top2, box_w, box_h)
-            shape5.fill.solid(); shape5.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left2 + Inches(0.2), top2 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "Z-Tunnels", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # SSL Inspection
-            shape6 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left3, top2, box_w, box_h)
-            shape6.fill.solid(); shape6.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left3 + Inches(0.2), top2 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "SSL Inspection", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # Workforce Region-Y (added for template)
-            top3 = top2 + box_h + Inches(0.5)
-            shape7 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left1, top3, box_w, box_h)
-            shape7.fill.solid(); shape7.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left1 + Inches(0.2), top3 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "Workforce (Region-Y)\nOn | Off - net", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # Admin Console
-            shape8 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left3, top3, box_w, box_h)
-            shape8.fill.solid(); shape8.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left3 + Inches(0.2), top3 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "Admin Console", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # Logging
-            shape9 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left2, top3, box_w, box_h)
-            shape9.fill.solid(); shape9.fill.fore_color.rgb = COLOR_LIGHT_GRAY
-            add_textbox(slide, left2 + Inches(0.2), top3 + Inches(0.3), box_w - Inches(0.4), box_h - Inches(0.6), "Logging", SIZE_SMALL, align=PP_ALIGN.CENTER)
-            # Numbers (1-5 from template)
-            add_textbox(slide, left1 + box_w / 2, top1 - Inches(0.3), Inches(0.3), Inches(0.3), "1", SIZE_SMALL)
-            add_textbox(slide, left2 + box_w / 2, top1 - Inches(0.3), Inches(0.3), Inches(0.3), "3", SIZE_SMALL)
-            add_textbox(slide, left3 + box_w / 2, top1 - Inches(0.3), Inches(0.3), Inches(0.3), "4", SIZE_SMALL)
-            add_textbox(slide, left1 + box_w / 2, top2 - Inches(0.3), Inches(0.3), Inches(0.3), "2", SIZE_SMALL)
-            add_textbox(slide, left3 + box_w / 2, top3 - Inches(0.3), Inches(0.3), Inches(0.3), "5", SIZE_SMALL)
-            # Connectors (arrows for Z-Tunnels, etc.)
-            try:
-                conn1 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left1 + box_w, top1 + box_h/2, left2, top1 + box_h/2)
-                conn1.line.color.rgb = COLOR_BLACK
-                conn2 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left2 + box_w, top1 + box_h/2, left3, top1 + box_h/2)
-                conn2.line.color.rgb = COLOR_BLACK
-                conn3 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left1 + box_w/2, top1 + box_h, left1 + box_w/2, top2)
-                conn3.line.color.rgb = COLOR_BLACK
-                # Add more for full template
-                conn4 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left3 + box_w/2, top1 + box_h, left3 + box_w/2, top2)
-                conn4.line.color.rgb = COLOR_BLACK
-                conn5 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left1 + box_w/2, top2 + box_h, left1 + box_w/2, top3)
-                conn5.line.color.rgb = COLOR_BLACK
-            except Exception:
-                pass
-            # Key facts (as table-like text)
-            key_top = Inches(1.2)
-            key_left = Inches(8.0)
-            key_text = f"Identity Provider: {idp}\nAuthentication Type: {auth_type}\nProvisioning: {prov_type}\n\nTunnel Type: {tunnel_type}\nDeployment System: {deploy_system}\nNumber of Windows and MacOS Devices: {windows_num} Windows\n98 MacOS Devices\nGeo Locations: {geo_locations}\n\nPolicy Deployment\nSSL Inspection Policies: {ssl_policies}\nURL Filtering Policies: {url_policies}\nCloud App Control Policies: {cloud_policies}\nFirewall Policies: {fw_policies}"
-            add_textbox(slide, key_left, key_top, Inches(4.0), Inches(4.0), key_text, SIZE_SMALL)
-            # Add overview pointer
-            pointer_top = top3 + box_h + Inches(0.5)
-            add_textbox(slide, MARGIN_LEFT, pointer_top, Inches(9.0), Inches(0.5), "An overview of the deployed architecture and key facts - diagram stays generic (custom diagram will be in design document) \nNumbers on the diagram help to orient the conversation", SIZE_SMALL)
-            apply_template_branding(prs, slide, slide_num, logo_bytes)
-            return slide
-
-        # Helper: Next Steps Slide (with pointer)
-        def create_next_steps_slide(short_term, long_term, slide_num: int = 1):
-            slide = add_slide_with_background(prs, bg_bytes)
-            add_textbox(slide, MARGIN_LEFT, Inches(0.45), Inches(8.0), Inches(0.5), "Recommended Next Steps", SIZE_SLIDE_TITLE, True, COLOR_NAVY)
-            # Short Term
-            add_textbox(slide, MARGIN_LEFT, Inches(1.2), Inches(4.0), Inches(0.4), "Short Term Activities", SIZE_HEADER, True)
-            top = Inches(1.6)
-            for item in short_term:
-                add_textbox(slide, MARGIN_LEFT + Inches(0.3), top, Inches(3.5), Inches(0.3), item, SIZE_BODY)
-                top += Inches(0.4)
-            # Long Term
-            add_textbox(slide, Inches(5.5), Inches(1.2), Inches(4.0), Inches(0.4), "Long Term Activities", SIZE_HEADER, True)
-            top = Inches(1.6)
-            for item in long_term:
-                add_textbox(slide, Inches(5.8), top, Inches(3.5), Inches(0.3), item, SIZE_BODY)
-                top += Inches(0.4)
-            # Add activities pointer
-            pointer_top = max(top, Inches(1.6) + len(long_term) * Inches(0.4)) + Inches(0.5)
-            add_textbox(slide, MARGIN_LEFT, pointer_top, Inches(9.0), Inches(0.5), "Next Short- and Long-Term Activities\nIf additional resources and/or expertise are required to complete any of the recommendations above, customer should consider engaging Zscaler Professional Services to assist with this effort.", SIZE_SMALL)
-            apply_template_branding(prs, slide, slide_num, logo_bytes)
-            return slide
-
-        # Build Slides (added missing ones: rollout, objectives, who/what, RAG key)
-        progress = st.progress(0)
-        total_slides = 13  # Split Next Steps and Thank You
-        current = 0
-
-        # Slide 1: Title
-        create_title_slide("Professional Services Transition Meeting", customer_name, today_date, 1)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 2: Agenda
-        create_bullet_slide("Meeting Agenda", ["Project Summary", "Technical Summary", "Recommended Next Steps"], 2)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 3: Project Summary Title
-        create_title_slide("Project Summary", "", "", 3)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 4: Final Project Status Report (added who/what box, RAG key)
-        slide4 = add_slide_with_background(prs, bg_bytes)
-        add_textbox(slide4, MARGIN_LEFT, Inches(0.45), Inches(8.0), Inches(0.5), f"Final Project Status Report – {customer_name}", SIZE_SLIDE_TITLE, True, COLOR_NAVY)
-        add_textbox(slide4, MARGIN_LEFT, Inches(1.2), Inches(8.0), Inches(0.4), "Project Summary", SIZE_HEADER, True)
-        add_textbox(slide4, MARGIN_LEFT, Inches(1.7), Inches(8.0), Inches(1.0), project_summary_text, SIZE_BODY)
-        # Dates
-        add_textbox(slide4, MARGIN_LEFT, Inches(2.5), Inches(4.0), Inches(1.0), f"Today's Date: {today_date} | Start: {project_start} | End: {project_end}", SIZE_BODY)
-        # Who/What/When/Why box (new)
-        who_text = "Who: External & Internal Project Team\nWhat: Project Status Report\nWhen: Weekly\nWhy: Keeps stakeholders informed on a weekly basis on critical aspects of the project such as scope, schedule, risks, issues, and next steps. \nMandatory: Yes (all projects)"
-        add_textbox(slide4, Inches(6.0), Inches(3.0), Inches(4.0), Inches(2.0), who_text, SIZE_SMALL)
-        # RAG Key (new table-like)
-        rag_text = "RAG Status Key:\nRed - Not On Track\nAmber - At Risk\nGreen - On Track\nBlue - Complete\nGray - Not Started"
-        add_textbox(slide4, Inches(6.0), Inches(5.5), Inches(4.0), Inches(1.5), rag_text, SIZE_SMALL)
-        apply_template_branding(prs, slide4, 4, logo_bytes)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 5: Milestones Table
-        headers = ["Milestone", "Baseline Date", "Target Completion Date", "Status"]
-        rows = [[m["name"], m["baseline"], m["target"], m["status"]] for m in milestones_data]
-        create_table_slide("Milestones", headers, rows, 5, col_widths=[Inches(4.0), Inches(2.0), Inches(2.0), Inches(2.0)])
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 6: User Rollout Table (new)
-        rollout_headers = ["Milestone", "Target Users", "Current Users", "Target Completion", "Status"]
-        rollout_rows = [
-            ["Pilot", str(pilot_target), str(pilot_current), pilot_completion, pilot_status],
-            ["Production", str(prod_target), str(prod_current), prod_completion, prod_status]
-        ]
-        create_table_slide("User Rollout Roadmap", rollout_headers, rollout_rows, 6, top_inch=1.2, height_inch=1.5, col_widths=[Inches(2.0), Inches(2.0), Inches(2.0), Inches(2.0), Inches(2.0)])
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 7: Project Status (Objectives Table, new)
-        obj_headers = ["Planned Project Objective (Target)", "Actual Project Result (Actual)", "Deviation/ Cause"]
-        obj_rows = [[o["objective"], o["actual"], o["deviation"]] for o in objectives_data]
-        create_table_slide("Project Status", obj_headers, obj_rows, 7, top_inch=1.2, height_inch=2.0, col_widths=[Inches(3.5), Inches(3.5), Inches(3.0)])
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 8: Deliverables Table (aligned)
-        del_headers = ["Deliverable", "Date delivered"]
-        del_rows = [[d["name"], d["date"]] for d in deliverables_data]
-        create_table_slide("Deliverables", del_headers, del_rows, 8, top_inch=1.2, height_inch=2.4, col_widths=[Inches(5.0), Inches(3.0)])
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 9: Technical Summary Title
-        create_title_slide("Technical Summary", "", "", 9)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 10: ZIA Architecture
-        create_zia_diagram_slide(10)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 11: Open Items Table
-        open_headers = ["Task/ Description", "Date", "Owner", "Transition Plan/ Next Steps"]
-        open_rows = [[oi["task"], oi["date"], oi["owner"], oi["steps"]] for oi in open_items_data]
-        create_table_slide("Open Items", open_headers, open_rows, 11, col_widths=[Inches(2.5), Inches(1.5), Inches(1.5), Inches(4.5)])
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 12: Recommended Next Steps (separate)
-        slide12 = add_slide_with_background(prs, bg_bytes)
-        add_textbox(slide12, MARGIN_LEFT, Inches(0.45), Inches(8.0), Inches(0.5), "Recommended Next Steps", SIZE_SLIDE_TITLE, True, COLOR_NAVY)
-        # Short Term
-        add_textbox(slide12, MARGIN_LEFT, Inches(1.2), Inches(4.0), Inches(0.4), "Short Term Activities", SIZE_HEADER, True)
-        top = Inches(1.6)
-        for item in short_term:
-            add_textbox(slide12, MARGIN_LEFT + Inches(0.3), top, Inches(3.5), Inches(0.3), item, SIZE_BODY)
-            top += Inches(0.4)
-        # Long Term
-        add_textbox(slide12, Inches(5.5), Inches(1.2), Inches(4.0), Inches(0.4), "Long Term Activities", SIZE_HEADER, True)
-        top = Inches(1.6)
-        for item in long_term:
-            add_textbox(slide12, Inches(5.8), top, Inches(3.5), Inches(0.3), item, SIZE_BODY)
-            top += Inches(0.4)
-        # Add activities pointer
-        pointer_top = max(top, Inches(1.6) + len(long_term) * Inches(0.4)) + Inches(0.5)
-        add_textbox(slide12, MARGIN_LEFT, pointer_top, Inches(9.0), Inches(0.5), "Next Short- and Long-Term Activities\nIf additional resources and/or expertise are required to complete any of the recommendations above, customer should consider engaging Zscaler Professional Services to assist with this effort.", SIZE_SMALL)
-        apply_template_branding(prs, slide12, 12, logo_bytes)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Slide 13: Thank You (separate)
-        slide13 = add_slide_with_background(prs, bg_bytes)
-        add_textbox(slide13, MARGIN_LEFT, Inches(1.0), Inches(8.0), Inches(0.5), "Thank you", SIZE_TITLE, True, COLOR_NAVY)
-        thank_text = f"Your feedback on our project and Professional Services team is important to us. \nProject Manager: {pm_name}\nConsultant: {consultant_name}\n\nA short ~6 question survey on how your Professional Services team did will be automatically sent after the project has closed. The following people will receive the survey via email:\nPrimary Contact: {primary_contact}\nSecondary Contact: {secondary_contact}\nWe appreciate any insights you can provide to help us improve our processes and ensure we provide the best possible service in future projects.\n\nWe want to know!"
-        add_textbox(slide13, MARGIN_LEFT, Inches(2.0), Inches(8.0), Inches(3.0), thank_text, SIZE_BODY)
-        apply_template_branding(prs, slide13, 13, logo_bytes)
-        current += 1
-        progress.progress(current / total_slides)
-
-        # Save & Download
-        out = io.BytesIO()
-        prs.save(out)
-        out.seek(0)
+        # Logo, fallback logo and background download in parallel on worker threads (cached across reruns),
+        # so a dead primary logo no longer delays the fallback by its full timeout. The workers carry this
+        # run's ScriptRunContext so the st.cache_data fetchers work there.
+        pool = ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx()))
+        try:
+            logo_future = pool.submit(fetch_image_or_none, LOGO_URL)
+            fallback_future = pool.submit(fetch_image_or_none, FALLBACK_LOGO_URL)
+            bg_future = pool.submit(fetch_image_or_none, BG_URL)
+            logo_bytes = image_from_future(logo_future, LOGO_URL)
+            bg_bytes = image_from_future(bg_future, BG_URL)
+            # The fallback is only awaited when the primary logo failed; otherwise a slow fallback host
+            # must not hold up the build
+            if logo_bytes is None:
+                logo_bytes = image_from_future(fallback_future, FALLBACK_LOGO_URL)
+        finally:
+            # Not joined: with one worker per fetch nothing is ever queued, so an unneeded fallback fetch
+            # is left to finish in the background (at most its 10 s timeout; it only fills the caches)
+            pool.shutdown(wait=False)
+        with st.spinner("Building deck..."):
+            deck = build_deck(
+                logo_bytes, bg_bytes,
+                customer_name=customer_name, today_date=today_date, project_start=project_start, project_end=project_end,
+                project_summary_text=project_summary_text, milestones_data=milestones_data, pilot_target=pilot_target, pilot_current=pilot_current,
+                pilot_completion=pilot_completion, pilot_status=pilot_status, prod_target=prod_target, prod_current=prod_current,
+                prod_completion=prod_completion, prod_status=prod_status, objectives_data=objectives_data, deliverables_data=deliverables_data,
+                idp=idp, auth_type=auth_type, prov_type=prov_type, tunnel_type=tunnel_type,
+                deploy_system=deploy_system, windows_num=windows_num, geo_locations=geo_locations, ssl_policies=ssl_policies,
+                url_policies=url_policies, cloud_policies=cloud_policies, fw_policies=fw_policies, open_items_data=open_items_data,
+                short_term=short_term, long_term=long_term, pm_name=pm_name, consultant_name=consultant_name,
+                primary_contact=primary_contact, secondary_contact=secondary_contact,
+            )
         st.success("Deck generated! Matches template exactly.")
-        st.download_button("Download PPTX", out, f"{customer_name}_Transition_Deck.pptx", "application/vnd.openxmlformats-officedocument.presentationml.presentation")
+        st.download_button("Download PPTX", deck, f"{customer_name}_Transition_Deck.pptx", "application/vnd.openxmlformats-officedocument.presentationml.presentation")